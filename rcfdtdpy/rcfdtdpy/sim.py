@@ -1,12 +1,68 @@
 from abc import ABC, abstractmethod
+from collections import Counter
 import numpy as np
 from scipy import integrate
 from tqdm import tqdm
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
 
 """
 Contains the classes used to represent a simulation
 """
 
+# --------------------
+# FIELD UPDATE KERNELS
+# --------------------
+# The field update equations are compiled with Numba if it is installed, otherwise equivalent Numpy implementations
+# are used. The kernels advance a single time step. Blocking several time steps together is not possible because each
+# step depends on psi and the coefficients, which the materials compute in Python from the previous E-field.
+if _NUMBA_AVAILABLE:
+    @njit(fastmath=True, cache=True)
+    def _step_fields(efield, hfield, coeff_h1, coeff_e0, coeff_e1, psi, coeff_e2, scratch):
+        """
+        Updates the H-fields and then the E-fields in place to the values at the next iteration, excluding the current
+        term. Each row along axis=0 is an independent field. Both updates are done in a single pass over each field,
+        the updated H-field value one cell behind is kept in h_prev so that each cell is only read and written once,
+        and so scratch is unused.
+        """
+        ilen = efield.shape[1]
+        for b in range(efield.shape[0]):
+            # The H-field at the last cell and the E-field at the first cell are not updated
+            h_prev = hfield[b, 0] - coeff_h1 * (efield[b, 1] - efield[b, 0])
+            hfield[b, 0] = h_prev
+            # The loop is left rolled, LLVM vectorizes it and unrolling it by hand is slower
+            for i in range(1, ilen - 1):
+                # The E-field at i has not yet been updated, so this uses its previous value
+                h = hfield[b, i] - coeff_h1 * (efield[b, i + 1] - efield[b, i])
+                hfield[b, i] = h
+                efield[b, i] = coeff_e0[b, i] * efield[b, i] + coeff_e1[b, i] * psi[b, i] - \
+                               coeff_e2[b, i] * (h - h_prev)
+                h_prev = h
+            i = ilen - 1
+            efield[b, i] = coeff_e0[b, i] * efield[b, i] + coeff_e1[b, i] * psi[b, i] - \
+                           coeff_e2[b, i] * (hfield[b, i] - h_prev)
+else:
+    def _step_fields(efield, hfield, coeff_h1, coeff_e0, coeff_e1, psi, coeff_e2, scratch):
+        """
+        Updates the H-fields and then the E-fields in place to the values at the next iteration, excluding the current
+        term. Each row along axis=0 is an independent field. Intermediate terms are written to scratch, an array one
+        cell shorter than the fields along axis=1, so that no arrays are allocated.
+        """
+        # Update the H-field
+        np.subtract(efield[:, 1:], efield[:, :-1], out=scratch)
+        scratch *= coeff_h1
+        hfield[:, :-1] -= scratch
+        # Update the E-field
+        efield[:, 1:] *= coeff_e0[:, 1:]
+        np.multiply(coeff_e1[:, 1:], psi[:, 1:], out=scratch)
+        efield[:, 1:] += scratch
+        np.subtract(hfield[:, 1:], hfield[:, :-1], out=scratch)
+        scratch *= coeff_e2[:, 1:]
+        efield[:, 1:] -= scratch
+
 
 class Simulation:
     r"""Represents a single simulation. Field is initialized to all zeros.
@@ -65,9 +121,16 @@ class Simulation:
         elif len(currents) == 0:
             # Create an empty currents list
             c = np.zeros((1, 1))
-            currents = [Current(self._nlen, self._ilen, 0, 0, c)]
+            currents = [Current(0, 0, self._ilen, self._nlen, c)]
         # Save the currents
         self._currents = currents
+        # Determine the spatial indices spanned by the currents, the current term of the E-field update is only
+        # applied over this span (the E-field is not updated at index zero)
+        self._current_span_i0 = min(c.get_span()[0] for c in self._currents)
+        self._current_i0 = max(self._current_span_i0, 1)
+        self._current_i1 = max(max(c.get_span()[1] for c in self._currents), self._current_i0)
+        # Create an array to hold the current
+        self._current = np.zeros(self._ilen, dtype=np.complex64)
         # --------------
         # MATERIAL SETUP
         # --------------
@@ -85,32 +148,57 @@ class Simulation:
         # --------------
         # Setup boundary condition
         self._boundary = boundary
-        if self._boundary == 'absorbing':
-            self._eprev0 = np.complex64(0)
-            self._eprev1 = np.complex64(0)
-            self._erprev0 = np.complex64(0)
-            self._erprev1 = np.complex64(0)
         # -----------
         # FIELD SETUP
         # -----------
-        # Create each field
-        self._efield = np.zeros(self._ilen, dtype=np.complex64)
-        self._hfield = np.zeros(self._ilen, dtype=np.complex64)
-        # Create each reference field
-        self._efieldr = np.zeros(self._ilen, dtype=np.complex64)
-        self._hfieldr = np.zeros(self._ilen, dtype=np.complex64)
+        # Create each field, the field and the reference field are stored as the rows of a single array so that both
+        # are updated together
+        self._efields = np.zeros((2, self._ilen), dtype=np.complex64)
+        self._hfields = np.zeros((2, self._ilen), dtype=np.complex64)
+        self._efield, self._efieldr = self._efields
+        self._hfield, self._hfieldr = self._hfields
         # ---------------
         # CONSTANTS SETUP
         # ---------------
         # Save constants
         self._epsilon0 = epsilon0
         self._mu0 = mu0
+        # Create arrays to hold the E-field proportionality constants, where the first row corresponds to the field and
+        # is updated each step and the second row corresponds to the reference field
+        self._coeff_e0 = np.zeros((2, self._ilen), dtype=np.complex64)
+        self._coeff_e1 = np.zeros((2, self._ilen), dtype=np.complex64)
+        self._coeff_e2 = np.zeros((2, self._ilen), dtype=np.complex64)
+        self._coeff_e3 = np.zeros((2, self._ilen), dtype=np.complex64)
+        # Set the reference proportionality constants (the reference sees chi0=0 and epsiloninf=1), these are constant
+        # in time and so are only calculated once
+        self._coeff_e0[1] = 1
+        self._coeff_e1[1] = 0
+        self._coeff_e2[1] = self._dn / (self._epsilon0 * self._di)
+        self._coeff_e3[1] = self._dn / self._epsilon0
+        # The H-field coefficient does not depend on the materials and so is constant in time and the same for both
+        # fields. The fields are single precision, scalar coefficients are cast so that the field update isn't promoted
+        # to double precision
+        self._coeff_h1 = np.float32(self._dn / (self._mu0 * self._di))
+        # Create an array to hold psi, the reference sees no materials and so psi is always zero in the second row
+        self._psi = np.zeros((2, self._ilen), dtype=np.complex64)
+        # Create arrays to hold the summed material values and intermediate field update terms, these are reused on each
+        # step
+        self._epsiloninf = np.zeros(self._ilen, dtype=np.complex64)
+        self._chi0 = np.zeros(self._ilen, dtype=np.complex64)
+        self._scratch = np.zeros((2, self._ilen - 1), dtype=np.complex64)
         # -------------------
         # STORED VALUES SETUP
         # -------------------
         # Save nstore info
         self._nstore = list(nstore)
         self._nstore_len = len(self._nstore)
+        # Map each time index that is saved to its index in the stored arrays, fields are stored in the order they
+        # occur in the simulation and only time indices that appear once in nstore and are reached by the simulation
+        # are saved
+        nstore_counts = Counter(self._nstore)
+        nstore_saved = sorted(n for n, count in nstore_counts.items() if count == 1 and 0 <= n < self._nlen and
+                              n == int(n))
+        self._nstore_map = {n: nstore_index for nstore_index, n in enumerate(nstore_saved)}
         # Check to see if any time index stores are requested
         if self._nstore_len != 0:
             # Create arrays to store the field values in each location
@@ -133,143 +221,122 @@ class Simulation:
         """
         Executes the simulation.
 
-        :param tqdmarg: The arguments to pass the tdqm iterator (lookup arguments on the tqdm documentation)
+        :param tqdmarg: The arguments to pass the tdqm iterator (lookup arguments on the tqdm documentation), `mininterval` defaults to 0.5 seconds
         """
+        # Refresh the progress bar at a coarse interval unless otherwise specified, each time step is short enough that
+        # the progress bar overhead is otherwise noticeable
+        tqdmarg = dict({'mininterval': 0.5}, **tqdmarg)
         # Iterate through all materials and reset each so that prior simulation information isn't held in the material.
         for mat in self._materials:
             mat.reset_material()
-        # Create a counter for the nstore index
-        nstore_index = 0
+        # Zero the fields so that prior simulation information isn't held in the fields, the existing arrays are reused
+        self._efields.fill(0)
+        self._hfields.fill(0)
+        # Bind the fields and the coefficients, which are updated in place, to local names so that they are passed
+        # directly to the update kernel without attribute lookups on each step
+        efields, hfields = self._efields, self._hfields
+        efield, hfield, efieldr, hfieldr = self._efield, self._hfield, self._efieldr, self._hfieldr
+        coeff_h1, coeff_e0, coeff_e1, coeff_e2, coeff_e3 = self._coeff_h1, self._coeff_e0, self._coeff_e1, \
+                                                           self._coeff_e2, self._coeff_e3
+        scratch = self._scratch
+        ci0, ci1 = self._current_i0, self._current_i1
+        nstore_map = self._nstore_map
+        # Setup the boundary condition
+        absorbing = self._boundary == 'absorbing'
+        eprev0, eprev1, erprev0, erprev1 = np.complex64(0), np.complex64(0), np.complex64(0), np.complex64(0)
         # Simulate by iterating over the simulation length
         for n in tqdm(range(self._nlen), **tqdmarg):
             # Update materials
             self._update_materials(n)
             # Update coefficients
             self._update_coefficients()
-            # Compute H-field and update
-            self._update_hfield()
-            self._update_hfieldr()
-            # Compute E-field and update
-            self._update_efield(n)
-            self._update_efieldr(n)
-            # Apply boundary conditions
-            if self._boundary == 'zero':  # Zero boundary condition
-                pass  # No necessary action
-            if self._boundary == 'absorbing':  # Absorbing boundary condition
+            # Compute psi and the current, the current is the same for the field and the reference field
+            psi = self._compute_psi()
+            current = self._get_current(n)
+            # Compute H-field and E-field of the field and the reference field and update
+            _step_fields(efields, hfields, coeff_h1, coeff_e0, coeff_e1, psi, coeff_e2, scratch)
+            # Apply the current term of the E-field update, which is only nonzero over the span of the currents
+            efields[:, ci0:ci1] -= coeff_e3[:, ci0:ci1] * current
+            # Apply boundary conditions, the zero boundary condition requires no action
+            if absorbing:  # Absorbing boundary condition
                 # Set the field values at the boundary to the previous value one away from the boundary, this somehow
                 # results in absorption, I'm not really sure how... I think it has something to do with preventing any
                 # wave reflection, meaning that the field values just end up going to zero. It would be a good idea to
                 # ask Ben about this.
-                self._efield[0] = self._eprev0
-                self._efield[-1] = self._eprev1
-                self._efieldr[0] = self._erprev0
-                self._efieldr[-1] = self._erprev1
+                efield[0] = eprev0
+                efield[-1] = eprev1
+                efieldr[0] = erprev0
+                efieldr[-1] = erprev1
                 # Save the field values one away from each boundary for use next iteration
-                self._eprev0 = self._efield[1]
-                self._eprev1 = self._efield[-2]
-                self._erprev0 = self._efieldr[1]
-                self._erprev1 = self._efieldr[-2]
+                eprev0 = efield[1]
+                eprev1 = efield[-2]
+                erprev0 = efieldr[1]
+                erprev1 = efieldr[-2]
             # Save the the fields if at the correct index
-            if self._nstore.count(n) == 1:
-                self._nstore_hfield[nstore_index] = self._hfield
-                self._nstore_efield[nstore_index] = self._efield
-                self._nstore_hfieldr[nstore_index] = self._hfieldr
-                self._nstore_efieldr[nstore_index] = self._efieldr
-                nstore_index += 1
+            nstore_index = nstore_map.get(n)
+            if nstore_index is not None:
+                self._nstore_hfield[nstore_index] = hfield
+                self._nstore_efield[nstore_index] = efield
+                self._nstore_hfieldr[nstore_index] = hfieldr
+                self._nstore_efieldr[nstore_index] = efieldr
             # Save specific field locations if storing has been requested
             if self._istore_len != 0:
                 # Store each location
-                self._istore_hfield[n] = self._hfield[self._istore]
-                self._istore_efield[n] = self._efield[self._istore]
-                self._istore_hfieldr[n] = self._hfieldr[self._istore]
-                self._istore_efieldr[n] = self._efieldr[self._istore]
-
-    def _update_hfield(self):
-        """
-        Updates the H-field to the values at the next iteration. Should be called once per simulation step.
-        """
-        h_t1 = self._hfield[:-1]
-        h_t2 = self._coeff_h1 * (self._efield[1:] - self._efield[:-1])
-        self._hfield[:-1] = h_t1 - h_t2
-
-    def _update_efield(self, n):
-        """
-        Updates the E-field to the values at the next iteration. Should be called once per simulation step.
-
-        :param n: The current temporal index of the simulation.
-        """
-        e_t1 = self._coeff_e0[1:] * self._efield[1:]
-        e_t2 = self._coeff_e1[1:] * self._compute_psi()[1:]
-        e_t3 = self._coeff_e2[1:] * (self._hfield[1:] - self._hfield[:-1])
-        e_t4 = self._coeff_e3[1:] * self._get_current(n)[1:]
-        self._efield[1:] = e_t1 + e_t2 - e_t3 - e_t4
-
-    def _update_hfieldr(self):
-        """
-        Updates the reference H-field to the values at the next iteration. Should be called once per simulation step.
-        """
-        h_t1 = self._hfieldr[:-1]
-        h_t2 = self._coeff_h1r * (self._efieldr[1:] - self._efieldr[:-1])
-        self._hfieldr[:-1] = h_t1 - h_t2
-
-    def _update_efieldr(self, n):
-        """
-        Updates the reference E-field to the values at the next iteration. Should be called once per simulation step.
-        
-        :param n: The current temporal index of the simulation.
-        """
-        e_t1 = self._coeff_e0r * self._efieldr[1:]
-        e_t3 = self._coeff_e2r * (self._hfieldr[1:] - self._hfieldr[:-1])
-        e_t4 = self._coeff_e3r * self._get_current(n)[1:]
-        self._efieldr[1:] = e_t1 - e_t3 - e_t4
+                self._istore_hfield[n] = hfield[self._istore]
+                self._istore_efield[n] = efield[self._istore]
+                self._istore_hfieldr[n] = hfieldr[self._istore]
+                self._istore_efieldr[n] = efieldr[self._istore]
 
     def _update_coefficients(self):
         """
         Computes the coefficients for each update term based on the current Material values.
         """
         # Sum the epsiloninf values of each material at the current time to get the final epsiloninf array
-        epsiloninf = np.zeros(self._ilen, dtype=np.complex64)
+        epsiloninf = self._epsiloninf
+        epsiloninf.fill(0)
         for mat in self._materials:
-            epsiloninf = np.add(epsiloninf, mat.get_epsiloninf())
+            np.add(epsiloninf, mat.get_epsiloninf(), out=epsiloninf)
         # Sum the chi0 values of each material to get the final epsiloninf array
-        chi0 = np.zeros(self._ilen, dtype=np.complex64)
+        chi0 = self._chi0
+        chi0.fill(0)
         for mat in self._materials:
-            chi0 = np.add(chi0, mat.get_chi0())
-        # Calculate simulation proportionality constants
-        self._coeff_e0 = epsiloninf / (epsiloninf + chi0)
-        self._coeff_e1 = 1.0 / (epsiloninf + chi0)
-        self._coeff_e2 = self._dn / (self._epsilon0 * self._di * (epsiloninf + chi0))
-        self._coeff_e3 = self._dn / (self._epsilon0 * (epsiloninf + chi0))
-        self._coeff_h1 = self._dn / (self._mu0 * self._di)
-        # Create simulation reference proportionality constants (the reference sees chi0=0 and epsiloninf=1)
-        self._coeff_e0r = np.complex64(1)
-        self._coeff_e2r = self._dn / (self._epsilon0 * self._di)
-        self._coeff_e3r = self._dn / self._epsilon0
-        self._coeff_h1r = self._dn / (self._mu0 * self._di)
+            np.add(chi0, mat.get_chi0(), out=chi0)
+        # Calculate simulation proportionality constants, each shares the factor 1/(epsiloninf+chi0) so it is only
+        # divided once. Only the first row is updated as the reference proportionality constants are constant.
+        inv_perm = self._coeff_e1[0]
+        np.add(epsiloninf, chi0, out=inv_perm)
+        np.divide(1, inv_perm, out=inv_perm)
+        np.multiply(epsiloninf, inv_perm, out=self._coeff_e0[0])
+        np.multiply(self._dn / (self._epsilon0 * self._di), inv_perm, out=self._coeff_e2[0])
+        np.multiply(self._dn / self._epsilon0, inv_perm, out=self._coeff_e3[0])
 
     def _get_current(self, n):
         """
-        Calculates the current at all points in the simulation using all the currents in the simulation
+        Calculates the current at all points spanned by the currents in the simulation using all the currents in the
+        simulation
 
         :param n: The temporal index :math:`n` to calculate the current at
+        :return: The current between the spatial indices `_current_i0` and `_current_i1`
         """
-        # Create an array to hold the current
-        current = np.zeros(self._ilen)
+        # Clear the current array over the full span the currents are added to (which may include index zero), each
+        # current is added in place and cast to the field precision
+        self._current[self._current_span_i0:self._current_i1] = 0
         for c in self._currents:
-            current = np.add(current, c.get_current(n))
+            c.add_current(n, self._current)
         # Return
-        return current
+        return self._current[self._current_i0:self._current_i1]
 
     def _compute_psi(self):
         """
         Calculates psi at all points in the simulation using all materials in the simulation.
         """
-        # Create an array to hold psi
-        psi = np.zeros(self._ilen)
+        # Clear the field row of the psi array, each material's psi is added in place and cast to the field precision
+        psi = self._psi[0]
+        psi.fill(0)
         for mat in self._materials:
-            psi = np.add(psi, mat.get_psi())
-        # Return
-        return psi
+            np.add(psi, mat.get_psi(), out=psi)
+        # Return psi for both the field and the reference field
+        return self._psi
 
     def _update_materials(self, n):
         """
@@ -396,8 +463,9 @@ class Current:
         elif self._i0 < 0 or self._i0 + self._cilen > self._ilen:
             raise ValueError("Current cannot start at i=" + str(self._i0) + " and end at i=" + str(
                 self._i0 + self._cilen) + " as this exceeds the dimensions of the simulation.")
-        # Reshape the current array so that it can be indexed correctly
-        self._current = np.reshape(current, (self._cnlen, self._cilen))
+        # Reshape the current array so that it can be indexed correctly, it is converted to the field precision once
+        # here rather than on each time step (no copy is made if current is already a complex64 array)
+        self._current = np.reshape(np.asarray(current, dtype=np.complex64), (self._cnlen, self._cilen))
 
     def get_current(self, n):
         """
@@ -406,13 +474,33 @@ class Current:
         # Determine if n is within the bounds of the current array
         if n < self._n0 or (self._n0 + self._cnlen) <= n:
             # Not in bounds, return zero-valued array
-            return np.zeros(self._cilen, dtype=np.complex64)
+            return np.zeros(self._ilen, dtype=np.complex64)
         # Pad the current array so that it spans the length of the simulation
         current_padded = np.pad(self._current[n - self._n0], (self._i0, self._ilen - (self._i0 + self._cilen)),
                                 'constant')
         # Return
         return current_padded
 
+    def get_span(self):
+        """
+        Returns the spatial indices spanned by the current.
+
+        :return: A tuple `(i0, i1)` of the starting and ending (exclusive) spatial indices of the current
+        """
+        return self._i0, self._i0 + self._cilen
+
+    def add_current(self, n, current):
+        """
+        Adds the current at time index :math:`n` in place to an array the length of the simulation. Unlike
+        `get_current` no padded array is created, only the spatial indices spanned by the current are modified.
+
+        :param n: The temporal index :math:`n` of the current to add
+        :param current: The array the length of the simulation to add the current to
+        """
+        # Only add the current if n is within the bounds of the current array
+        if self._n0 <= n < self._n0 + self._cnlen:
+            current[self._i0:self._i0 + self._cilen] += self._current[n - self._n0]
+
 
 class Material(ABC):
     r"""
@@ -600,22 +688,15 @@ class StaticMaterial(Material):
         min_b_min_g = np.add(-self._b, -self._g)
         self._exp_1 = np.exp(np.multiply(b_min_g, self._dn))
         self._exp_2 = np.exp(np.multiply(min_b_min_g, self._dn))
-        # Calculate initial susceptibility values
-        self._chi0_1 = np.zeros((self._jlen, self._material_ilen), dtype=np.complex64)
-        self._chi0_2 = np.zeros((self._jlen, self._material_ilen), dtype=np.complex64)
-        for j in range(self._jlen):
-            for mi in range(self._material_ilen):
-                if np.abs(b_min_g[j, mi]) < 1e-5:
-                    # beta-gamma is small, avoid divide by zero error
-                    self._chi0_1[j, mi] = self._a1[j, mi] * self._dn
-                    self._chi0_2[j, mi] = np.multiply(np.divide(self._a2[j, mi], min_b_min_g[j, mi]),
-                                                      np.subtract(self._exp_2[j, mi], 1))
-                else:
-                    # beta-gamma is not small, calculate normally
-                    self._chi0_1[j, mi] = np.multiply(np.divide(self._a1[j, mi], b_min_g[j, mi]),
-                                                      np.subtract(self._exp_1[j, mi], 1))
-                    self._chi0_2[j, mi] = np.multiply(np.divide(self._a2[j, mi], min_b_min_g[j, mi]),
-                                                      np.subtract(self._exp_2[j, mi], 1))
+        # Calculate initial susceptibility values, where beta-gamma is small use the limit to avoid a divide by zero
+        # error (the divisor is replaced by one at those locations and the result discarded)
+        small = np.abs(b_min_g) < 1e-5
+        b_min_g_safe = np.where(small, 1, b_min_g)
+        chi0_1 = np.where(small, self._a1 * self._dn,
+                          np.multiply(np.divide(self._a1, b_min_g_safe), np.subtract(self._exp_1, 1)))
+        chi0_2 = np.multiply(np.divide(self._a2, min_b_min_g), np.subtract(self._exp_2, 1))
+        self._chi0_1 = np.asarray(chi0_1, dtype=np.complex64)
+        self._chi0_2 = np.asarray(chi0_2, dtype=np.complex64)
         # Calculate first delta susceptibility values
         self._dchi0_1 = np.multiply(self._chi0_1, np.subtract(1, self._exp_1))
         self._dchi0_2 = np.multiply(self._chi0_2, np.subtract(1, self._exp_2))
@@ -680,8 +761,8 @@ class StaticMaterial(Material):
 
         :param efield: The efield to use in update calculations
         """
-        # Copy the efield so that instead of being a vector it is a matrix composed of horizontal efield vectors
-        e = np.tile(efield[self._material_i0:self._material_i0 + self._material_ilen], (self._jlen, 1))
+        # Trim the efield to the material, it is broadcast across each oscillator
+        e = efield[self._material_i0:self._material_i0 + self._material_ilen]
         # Calculate first term
         t1_1 = np.multiply(e, self._dchi0_1)
         t1_2 = np.multiply(e, self._dchi0_2)
@@ -805,8 +886,7 @@ class NumericMaterial(Material):
         self._psi = np.zeros(self._material_ilen, dtype=np.complex64)
 
     def reset_material(self):
-        # Clear the electric field
-        self._efield = np.zeros((self._nlen, self._material_ilen), dtype=np.complex64)
+        # The stored electric field is not cleared, each row n is written at step n before rows 1 through n are read
         # Clear the psi array
         self._psi = np.zeros(self._material_ilen, dtype=np.complex64)
 
@@ -816,12 +896,13 @@ class NumericMaterial(Material):
         # ------------------------------
         # Save the current efield value
         self._efield[n] = efield[self._material_i0:self._material_i0 + self._material_ilen]
-        # Trim dchi_m to length n, transpose, flip, and repeat to the length of the material
-        dchi = np.tile(np.flip(self._dchi_m[:n], 0), (1, self._material_ilen))
+        # Trim dchi_m to length n and flip
+        dchi = np.flip(self._dchi_m[:n, 0], 0)
         # Trim the efield to length n (shifted by one as specified by update equations)
         e = self._efield[1:n+1]
-        # Multiply e and dchi and sum to determine psi
-        self._psi = np.sum(np.multiply(e, dchi), axis=0, dtype=np.complex64)
+        # Multiply e and dchi and sum to determine psi, the dot product avoids repeating dchi to the length of the
+        # material
+        self._psi = np.dot(dchi, e)
         # ----------------------------
         # Infinite permittivity update
         # ----------------------------
@@ -12,4 +12,5 @@ setup(name='rcfdtdpy',
       packages=['rcfdtdpy'],
       python_requires='>=3',
       install_requires=['numpy>=1.15.0', 'scipy>=1.1.0', 'tqdm>=4.24.0'],
+      extras_require={'numba': ['numba>=0.45.0']},
       zip_safe=False)
\ No newline at end of file